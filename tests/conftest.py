@@ -0,0 +1,29 @@
+import importlib.machinery
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# The connectors import each other relatively (from .base_connector import ...), but the
+# base module is checked in as "Base Data Connector"; load both into a package here.
+_PACKAGE = 'connectors'
+
+
+def _load(name, path):
+    spec = importlib.util.spec_from_file_location(
+        f'{_PACKAGE}.{name}', path,
+        loader=importlib.machinery.SourceFileLoader(f'{_PACKAGE}.{name}', str(path)))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+if _PACKAGE not in sys.modules:
+    package = types.ModuleType(_PACKAGE)
+    package.__path__ = []
+    sys.modules[_PACKAGE] = package
+    _load('base_connector', ROOT / 'Base Data Connector')
+    _load('web_analytics_connector', ROOT / 'web_analytics_connector.py')
@@ -0,0 +1,391 @@
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import connectors.base_connector as base_connector
+from connectors.web_analytics_connector import GoogleAnalyticsConnector, SimilarwebConnector
+
+
+class _Similarweb(SimilarwebConnector):
+    """SimilarwebConnector does not implement get_data, so fill it in for tests"""
+
+    def get_data(self, **kwargs):
+        return self.get_website_overview(**kwargs)
+
+
+def _report(rows, dimensions=('date', 'country'),
+            metrics=(('sessions', 'TYPE_INTEGER'), ('bounceRate', 'TYPE_FLOAT'))):
+    """Build a runReport response body"""
+    return {
+        'dimensionHeaders': [{'name': name} for name in dimensions],
+        'metricHeaders': [{'name': name, 'type': kind} for name, kind in metrics],
+        'rows': [
+            {'dimensionValues': [{'value': value} for value in dims],
+             'metricValues': [{'value': value} for value in mets]}
+            for dims, mets in rows
+        ],
+        'rowCount': len(rows)
+    }
+
+
+class _Server:
+    """Local HTTP server replaying queued (status, body, truncate) responses"""
+
+    def __init__(self):
+        self.responses = []
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                server.requests.append(parse_qs(urlsplit(self.path).query))
+                self._reply()
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                server.requests.append(json.loads(self.rfile.read(length)))
+                self._reply()
+
+            def _reply(self):
+                status, body, truncate = (server.responses.pop(0) if len(server.responses) > 1
+                                          else server.responses[0])
+                payload = json.dumps(body).encode() if body is not None else b''
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                if truncate:
+                    # Cut the body off mid-way and drop the connection
+                    self.wfile.write(payload[:len(payload) // 2])
+                    self.close_connection = True
+                    return
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.httpd.server_port}'
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def queue(self, body, status=200, truncate=False):
+        self.responses.append((status, body, truncate))
+
+    @property
+    def hits(self):
+        return len(self.requests)
+
+
+@pytest.fixture
+def server():
+    srv = _Server()
+    yield srv
+    srv.httpd.shutdown()
+
+
+@pytest.fixture
+def connector(server, monkeypatch):
+    monkeypatch.setattr(base_connector.time, 'sleep', lambda seconds: None)
+    ga = GoogleAnalyticsConnector(access_token='token', property_id='123')
+    ga.base_url = server.url
+    yield ga
+    ga.close()
+
+
+@pytest.fixture
+def similarweb(server, monkeypatch):
+    monkeypatch.setattr(base_connector.time, 'sleep', lambda seconds: None)
+    sw = _Similarweb(api_key='key')
+    sw.base_url = server.url
+    yield sw
+    sw.close()
+
+
+ROWS = [(('2024010%d' % day, country), (str(day * 10), '0.25'))
+        for day in range(1, 8) for country in ('FR', 'US')]
+
+
+@pytest.mark.parametrize('threshold', [0, 10 ** 9], ids=['streamed', 'parsed'])
+def test_streamed_and_parsed_paths_build_same_frame(connector, server, monkeypatch, threshold):
+    monkeypatch.setattr(GoogleAnalyticsConnector, 'STREAM_THRESHOLD_BYTES', threshold)
+    server.queue(_report(ROWS))
+
+    df = connector.get_data(['sessions', 'bounceRate'], ['date', 'country'])
+
+    assert list(df.columns) == ['date', 'country', 'sessions', 'bounceRate', 'retrieved_at']
+    assert len(df) == len(ROWS)
+    assert df['sessions'].dtype == np.int64
+    assert df['bounceRate'].dtype == np.float32
+    assert isinstance(df['country'].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_datetime64_any_dtype(df['date'])
+    assert df['sessions'].tolist() == [int(mets[0]) for _, mets in ROWS]
+
+
+@pytest.mark.parametrize('threshold', [0, 10 ** 9], ids=['streamed', 'parsed'])
+def test_truncated_body_is_retried(connector, server, monkeypatch, threshold):
+    monkeypatch.setattr(GoogleAnalyticsConnector, 'STREAM_THRESHOLD_BYTES', threshold)
+    server.queue(_report(ROWS), truncate=True)
+    server.queue(_report(ROWS))
+
+    df = connector.get_data(['sessions', 'bounceRate'], ['date', 'country'])
+
+    assert server.hits == 2
+    assert len(df) == len(ROWS)
+
+
+def test_persistent_server_error_retries_once_per_attempt(connector, server):
+    server.queue({'error': 'unavailable'}, status=503)
+
+    with pytest.raises(base_connector.requests.exceptions.HTTPError):
+        connector.get_data(['sessions'])
+
+    # One initial attempt plus max_retries=3, with no adapter-level retries on top
+    assert server.hits == 4
+
+
+def test_repeated_query_is_served_from_cache(connector, server):
+    server.queue(_report(ROWS))
+
+    first = connector.get_data(['sessions', 'bounceRate'], ['date', 'country'])
+    second = connector.get_data(['sessions', 'bounceRate'], ['date', 'country'])
+    connector.invalidate()
+    connector.get_data(['sessions', 'bounceRate'], ['date', 'country'])
+
+    assert server.hits == 2
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_available_datasets_are_independent_copies(connector):
+    datasets = connector.get_available_datasets()
+    datasets.append('junk')
+    datasets[0]['name'] = 'junk'
+
+    assert connector.get_available_datasets()[0]['name'] == 'sessions'
+    assert 'junk' not in connector.get_available_datasets()
+
+
+def test_large_counts_keep_integer_precision(connector, server):
+    server.queue(_report([(('20240101',), ('3000000000', '123456789'))], dimensions=('date',),
+                         metrics=(('sessions', 'TYPE_INTEGER'), ('eventCount', 'TYPE_INTEGER'))))
+
+    df = connector.get_data(['sessions', 'eventCount'])
+
+    assert df['sessions'].tolist() == [3000000000]
+    assert df['eventCount'].tolist() == [123456789]
+
+
+def test_metric_dtypes_follow_ga4_metric_types(connector, server):
+    server.queue(_report([(('20240101',), ('1', '0.5', '12.25'))], dimensions=('date',),
+                         metrics=(('sessions', 'TYPE_INTEGER'), ('bounceRate', 'TYPE_FLOAT'),
+                                  ('purchaseRevenue', 'TYPE_CURRENCY'))))
+
+    df = connector.get_data(['sessions', 'bounceRate', 'purchaseRevenue'])
+
+    assert df['sessions'].dtype == np.int64
+    assert df['bounceRate'].dtype == np.float32
+    assert df['purchaseRevenue'].dtype == np.float64
+
+
+def test_parallel_fetch_partitions_range_and_keeps_dtypes(connector, monkeypatch):
+    ranges = []
+
+    def fake_get_data(metrics, dimensions, start_date, end_date):
+        ranges.append((start_date, end_date))
+        return pd.DataFrame({
+            'date': pd.to_datetime([start_date]),
+            'country': pd.Categorical([start_date]),
+            'sessions': np.array([1], dtype=np.int64)
+        })
+
+    monkeypatch.setattr(connector, 'get_data', fake_get_data)
+
+    df = connector.get_data_parallel(['sessions'], ['date', 'country'],
+                                     '2024-01-01', '2024-01-10', chunks=3)
+
+    assert sorted(ranges) == [('2024-01-01', '2024-01-04'), ('2024-01-05', '2024-01-07'),
+                              ('2024-01-08', '2024-01-10')]
+    assert len(df) == 3
+    assert isinstance(df['country'].dtype, pd.CategoricalDtype)
+    assert df['sessions'].dtype == np.int64
+
+
+def test_parallel_fetch_requires_date_dimension(connector):
+    with pytest.raises(ValueError):
+        connector.get_data_parallel(['sessions'], ['country'])
+
+
+def test_empty_report_keeps_schema(connector, server):
+    body = _report([])
+    del body['rows']
+    server.queue(body)
+
+    df = connector.get_data(['sessions', 'bounceRate'], ['date', 'country'])
+
+    assert df.empty
+    assert list(df.columns) == ['date', 'country', 'sessions', 'bounceRate', 'retrieved_at']
+    assert df['sessions'].dtype == np.int64
+    assert df['bounceRate'].dtype == np.float32
+
+
+@pytest.fixture
+def httpx_connector(server, monkeypatch):
+    pytest.importorskip('httpx')
+    monkeypatch.setattr(base_connector.time, 'sleep', lambda seconds: None)
+    ga = GoogleAnalyticsConnector(access_token='token', property_id='123', transport='httpx')
+    ga.base_url = server.url
+    yield ga
+    ga.close()
+
+
+def test_httpx_transport_fetches_report(httpx_connector, server):
+    server.queue(_report(ROWS))
+
+    df = httpx_connector.get_data(['sessions', 'bounceRate'], ['date', 'country'])
+
+    assert httpx_connector.session is None
+    assert len(df) == len(ROWS)
+    assert df['sessions'].tolist() == [int(mets[0]) for _, mets in ROWS]
+
+
+def test_httpx_transport_retries_server_errors(httpx_connector, server):
+    server.queue({'error': 'unavailable'}, status=503)
+    server.queue(_report(ROWS))
+
+    df = httpx_connector.get_data(['sessions', 'bounceRate'], ['date', 'country'])
+
+    assert server.hits == 2
+    assert len(df) == len(ROWS)
+
+
+def test_cache_purges_expired_entries_and_caps_size(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(base_connector.time, 'monotonic', lambda: now[0])
+    cache = base_connector._TTLCache(default_ttl=10, max_entries=3)
+
+    for key in range(1000):
+        cache.set(key, key)
+    assert len(cache) == 3
+
+    now[0] = 20.0
+    cache.set('fresh', 1)
+    assert len(cache) == 1
+    assert cache.get('fresh') == 1
+
+
+def test_zero_cache_ttl_disables_caching(server, monkeypatch):
+    monkeypatch.setattr(base_connector.time, 'sleep', lambda seconds: None)
+    ga = GoogleAnalyticsConnector(access_token='token', property_id='123', cache_ttl=0)
+    ga.base_url = server.url
+    server.queue(_report(ROWS))
+
+    ga.get_data(['sessions', 'bounceRate'], ['date', 'country'])
+    ga.get_data(['sessions', 'bounceRate'], ['date', 'country'])
+    ga.close()
+
+    assert server.hits == 2
+
+
+def test_polars_engine_matches_pandas_frame(connector, server):
+    pl = pytest.importorskip('polars')
+    server.queue(_report(ROWS))
+
+    expected = connector.get_data(['sessions', 'bounceRate'], ['date', 'country'])
+    df = connector.get_data(['sessions', 'bounceRate'], ['date', 'country'], engine='polars')
+
+    assert isinstance(df, pl.DataFrame)
+    assert df.columns == list(expected.columns)
+    assert df.schema['date'] == pl.Datetime
+    assert df.schema['country'] == pl.Categorical
+    assert df['sessions'].to_list() == expected['sessions'].tolist()
+    assert df['country'].cast(pl.Utf8).to_list() == expected['country'].astype(str).tolist()
+
+
+def test_polars_engine_missing_fails_before_request(connector, server, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'polars', None)
+    server.queue(_report(ROWS))
+
+    with pytest.raises(ImportError):
+        connector.get_data(['sessions'], engine='polars')
+
+    assert server.hits == 0
+
+
+def test_ga4_dates_are_parsed_from_compact_format(connector, server):
+    server.queue(_report([(('20240131', 'FR'), ('1', '0.5'))]))
+
+    df = connector.get_data(['sessions', 'bounceRate'], ['date', 'country'])
+
+    assert df['date'].tolist() == [pd.Timestamp('2024-01-31')]
+
+
+@pytest.mark.parametrize('granularity', ['daily', 'monthly'])
+def test_similarweb_dates_are_parsed_for_both_granularities(similarweb, server, granularity):
+    server.queue({'visits': [{'date': '2024-01-01', 'visits': 10.0},
+                             {'date': '2024-02-01', 'visits': 12.5}]})
+
+    df = similarweb.get_website_overview('example.com', '2024-01', '2024-02',
+                                         granularity=granularity)
+
+    assert df['date'].tolist() == [pd.Timestamp('2024-01-01'), pd.Timestamp('2024-02-01')]
+    assert server.requests[0]['granularity'] == [granularity]
+
+
+def test_similarweb_overview_has_typed_columns(similarweb, server):
+    server.queue({'visits': [{'date': '2024-01-01', 'visits': 10},
+                             {'date': '2024-02-01', 'visits': 12.5}]})
+
+    df = similarweb.get_website_overview('example.com', '2024-01', '2024-02')
+
+    assert list(df.columns) == ['date', 'visits', 'domain', 'retrieved_at']
+    assert df['visits'].dtype == np.float64
+    assert df['visits'].tolist() == [10.0, 12.5]
+    assert isinstance(df['domain'].dtype, pd.CategoricalDtype)
+    assert list(df['domain'].cat.categories) == ['example.com']
+    assert df['domain'].tolist() == ['example.com', 'example.com']
+
+
+@pytest.mark.parametrize('inplace', [True, False])
+def test_validate_data_drops_empty_rows(connector, inplace):
+    df = pd.DataFrame({'a': [1.0, np.nan, 3.0], 'b': ['x', None, 'z']})
+
+    result = connector._validate_data(df, inplace=inplace)
+
+    assert result['a'].tolist() == [1.0, 3.0]
+    assert 'retrieved_at' in result.columns
+    if inplace:
+        assert result is df
+    else:
+        assert result is not df
+        assert len(df) == 3 and 'retrieved_at' not in df.columns
+
+
+@pytest.mark.parametrize('streamed', [False, True], ids=['parsed', 'streamed'])
+def test_arrow_and_numpy_construction_match(connector, monkeypatch, streamed):
+    pytest.importorskip('pyarrow')
+    web_analytics = sys.modules[GoogleAnalyticsConnector.__module__]
+
+    def build():
+        body = _report(ROWS)
+        report = connector._extract_columns(body)
+        if streamed:
+            # The streamed path hands over plain lists of strings
+            report = report._replace(
+                dim_cols=[[row['dimensionValues'][i]['value'] for row in body['rows']]
+                          for i in range(len(report.dimension_headers))],
+                met_cols=[[row['metricValues'][i]['value'] for row in body['rows']]
+                          for i in range(len(report.metric_headers))])
+        return connector._build_pandas_frame(report)
+
+    arrow_df = build()
+    monkeypatch.setattr(web_analytics, 'pa', None)
+    numpy_df = build()
+
+    pd.testing.assert_frame_equal(arrow_df, numpy_df)
@@ -1,28 +1,124 @@
-from typing import Dict, Any, List, Optional
+from typing import (Dict, Any, List, Optional, Tuple, Literal, NamedTuple, Union,
+                    TYPE_CHECKING, overload)
+from functools import lru_cache
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from pandas.api.types import union_categoricals
+from datetime import date, datetime, timedelta
+import importlib.util
+import itertools
 import json
 from .base_connector import BaseDataConnector
 
+if TYPE_CHECKING:
+    import polars
+
+try:
+    import ijson
+except ImportError:  # large reports are then parsed in one go
+    ijson = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # frames are then assembled from NumPy columns
+    pa = None
+
+class _ReportColumns(NamedTuple):
+    """Per-column values of a runReport response, before DataFrame construction"""
+    dimension_headers: List[str]
+    metric_headers: List[str]
+    metric_dtypes: List[type]
+    dim_cols: Optional[list]
+    met_cols: Optional[list]
+
+
+@lru_cache(maxsize=64)
+def _name_objects(names: Tuple[str, ...]) -> List[Dict[str, str]]:
+    """Build the shared, read-only [{'name': ...}] list for a tuple of field names"""
+    return [{'name': name} for name in names]
+
+
+@lru_cache(maxsize=64)
+def _build_body(metrics: Tuple[str, ...], dimensions: Tuple[str, ...],
+                start_date: str, end_date: str) -> bytes:
+    """
+    Build and encode a runReport request body, memoized for repeated polling
+    
+    Args:
+        metrics: Metric names
+        dimensions: Dimension names
+        start_date: Start date
+        end_date: End date
+        
+    Returns:
+        JSON-encoded request body
+    """
+    # Only the date range is new when a fixed report is polled for a different window
+    return BaseDataConnector._encode_body({
+        'dateRanges': [{'startDate': start_date, 'endDate': end_date}],
+        'metrics': _name_objects(metrics),
+        'dimensions': _name_objects(dimensions)
+    })
+
+
 class GoogleAnalyticsConnector(BaseDataConnector):
   
     """
     Connector for Google Analytics Data API (GA4)
     """
     
-    def __init__(self, access_token: str, property_id: str):
+    # Responses larger than this are parsed incrementally when ijson is installed
+    STREAM_THRESHOLD_BYTES = 256 * 1024
+    
+    # Storage dtypes by the metricHeaders[].type GA4 reports. Counts stay exact in
+    # int64; TYPE_FLOAT holds rates and ratios, where float32's ~7 significant digits
+    # are plenty. Every other type (currencies, durations, custom) is float64.
+    _METRIC_DTYPES = {
+        'TYPE_INTEGER': np.int64,
+        'TYPE_FLOAT': np.float32
+    }
+    
+    # Bounded-cardinality dimensions stored as categoricals
+    _CATEGORICAL_DIMENSIONS = ('country', 'deviceCategory', 'source', 'medium')
+    
+    # Metrics and dimensions reported by get_available_datasets
+    _DATASETS = (
+        {'name': 'sessions', 'type': 'metric', 'description': 'Total number of sessions'},
+        {'name': 'users', 'type': 'metric', 'description': 'Total number of users'},
+        {'name': 'pageviews', 'type': 'metric', 'description': 'Total number of pageviews'},
+        {'name': 'bounceRate', 'type': 'metric', 'description': 'Bounce rate percentage'},
+        {'name': 'sessionDuration', 'type': 'metric', 'description': 'Average session duration'},
+        {'name': 'date', 'type': 'dimension', 'description': 'Date dimension'},
+        {'name': 'country', 'type': 'dimension', 'description': 'Country dimension'},
+        {'name': 'deviceCategory', 'type': 'dimension', 'description': 'Device category'},
+        {'name': 'source', 'type': 'dimension', 'description': 'Traffic source'},
+        {'name': 'medium', 'type': 'dimension', 'description': 'Traffic medium'}
+    )
+    
+    # Fixed report shapes, kept immutable so they pass through get_data without copies
+    _OVERVIEW_METRICS = ('sessions', 'users', 'pageviews', 'bounceRate', 'averageSessionDuration')
+    _OVERVIEW_DIMENSIONS = ('date',)
+    _SOURCES_METRICS = ('sessions', 'users')
+    _SOURCES_DIMENSIONS = ('source', 'medium')
+    
+    def __init__(self, access_token: str, property_id: str, transport: str = 'requests',
+                 cache_ttl: float = 300):
         """
         Initialize Google Analytics connector
         
         Args:
             access_token: Google Analytics API access token
             property_id: GA4 property ID
+            transport: 'requests' or 'httpx' for HTTP/2
+            cache_ttl: Lifetime in seconds of cached reports; 0 disables caching
         """
         super().__init__(
             api_key=access_token,
             base_url="https://analyticsdata.googleapis.com/v1beta",
             rate_limit_requests=100,  # Google Analytics API rate limits
-            rate_limit_window=100  # 100 seconds
+            rate_limit_window=100,  # 100 seconds
+            cache_ttl=cache_ttl,
+            transport=transport
         )
         self.property_id = property_id
     
@@ -39,22 +135,22 @@ class GoogleAnalyticsConnector(BaseDataConnector):
         Returns:
             List of available metrics and dimensions
         """
-        return [
-            {'name': 'sessions', 'type': 'metric', 'description': 'Total number of sessions'},
-            {'name': 'users', 'type': 'metric', 'description': 'Total number of users'},
-            {'name': 'pageviews', 'type': 'metric', 'description': 'Total number of pageviews'},
-            {'name': 'bounceRate', 'type': 'metric', 'description': 'Bounce rate percentage'},
-            {'name': 'sessionDuration', 'type': 'metric', 'description': 'Average session duration'},
-            {'name': 'date', 'type': 'dimension', 'description': 'Date dimension'},
-            {'name': 'country', 'type': 'dimension', 'description': 'Country dimension'},
-            {'name': 'deviceCategory', 'type': 'dimension', 'description': 'Device category'},
-            {'name': 'source', 'type': 'dimension', 'description': 'Traffic source'},
-            {'name': 'medium', 'type': 'dimension', 'description': 'Traffic medium'}
-        ]
+        return [dict(dataset) for dataset in self._DATASETS]
     
+    @overload
     def get_data(self, metrics: List[str], dimensions: List[str] = None,
                  start_date: str = '30daysAgo', end_date: str = 'today',
-                 **kwargs) -> pd.DataFrame:
+                 engine: Literal['pandas'] = 'pandas', **kwargs) -> pd.DataFrame: ...
+    
+    @overload
+    def get_data(self, metrics: List[str], dimensions: List[str] = None,
+                 start_date: str = '30daysAgo', end_date: str = 'today',
+                 *, engine: Literal['polars'], **kwargs) -> 'polars.DataFrame': ...
+    
+    def get_data(self, metrics: List[str], dimensions: List[str] = None,
+                 start_date: str = '30daysAgo', end_date: str = 'today',
+                 engine: Literal['pandas', 'polars'] = 'pandas',
+                 **kwargs) -> Union[pd.DataFrame, 'polars.DataFrame']:
         """
         Get Google Analytics data
         
@@ -63,53 +159,389 @@ class GoogleAnalyticsConnector(BaseDataConnector):
             dimensions: List of dimensions to group by
             start_date: Start date (YYYY-MM-DD or relative like '30daysAgo')
             end_date: End date (YYYY-MM-DD or relative like 'today')
+            engine: 'pandas' for a pandas DataFrame, or 'polars' for a polars.DataFrame
+                with the same columns (date as Datetime, categorical dimensions as
+                Categorical, metrics as Int64/Float64)
             
         Returns:
             DataFrame with analytics data
         """
+        if engine not in ('pandas', 'polars'):
+            raise ValueError(f"Unsupported engine: {engine}")
+        
+        # Fail before spending a request (and API quota) on a frame we can't build
+        if engine == 'polars' and importlib.util.find_spec('polars') is None:
+            raise ImportError("engine='polars' requires the polars package")
+        
         if dimensions is None:
             dimensions = ['date']
         
+        cache_key = ('runReport', self.property_id, tuple(metrics), tuple(dimensions),
+                     start_date, end_date, engine)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached.clone() if engine == 'polars' else cached.copy()
+        
         # Prepare request body
-        request_body = {
-            'dateRanges': [{'startDate': start_date, 'endDate': end_date}],
-            'metrics': [{'name': metric} for metric in metrics],
-            'dimensions': [{'name': dimension} for dimension in dimensions]
-        }
+        request_body = _build_body(tuple(metrics), tuple(dimensions), start_date, end_date)
         
         endpoint = f'properties/{self.property_id}:runReport'
-        response = self._make_request(endpoint, method='POST', data=request_body)
+        report = self._make_request(endpoint, method='POST', data=request_body,
+                                    parse=self._parse_report)
         
-        if 'rows' not in response:
-            return pd.DataFrame()
+        if report.dim_cols is None:
+            # No data for this range: keep the report's columns and dtypes so callers
+            # don't hit KeyErrors, without touching the row-building paths
+            if not report.dimension_headers and not report.metric_headers:
+                report = report._replace(
+                    dimension_headers=list(dimensions), metric_headers=list(metrics),
+                    metric_dtypes=[self._metric_dtype(None) for _ in metrics])
+            report = report._replace(dim_cols=[[] for _ in report.dimension_headers],
+                                     met_cols=[[] for _ in report.metric_headers])
         
-        # Extract data
-        rows = response['rows']
-        dimension_headers = [dim['name'] for dim in response.get('dimensionHeaders', [])]
-        metric_headers = [met['name'] for met in response.get('metricHeaders', [])]
+        if engine == 'polars':
+            df = self._build_polars_frame(report)
+            self._cache.set(cache_key, df)
+            return df.clone()
         
-        # Flatten data
-        flattened_data = []
-        for row in rows:
-            row_data = {}
+        df = self._build_pandas_frame(report)
+        
+        # Convert date column if present
+        if 'date' in df.columns:
+            df['date'] = pd.to_datetime(df['date'], format='%Y%m%d', cache=True)
+        
+        self._validate_data(df, inplace=True)
+        self._cache.set(cache_key, df)
+        return df.copy()
+    
+    def _build_pandas_frame(self, report: _ReportColumns) -> pd.DataFrame:
+        """
+        Build a pandas DataFrame from the collected report columns
+        
+        Goes through a PyArrow table when pyarrow is installed, so string metrics are
+        parsed by Arrow's casts and the buffers are handed to pandas without a copy.
+        The resulting dtypes are the same either way.
+        
+        Args:
+            report: Collected report columns
             
-            # Add dimensions
-            for i, dim_value in enumerate(row.get('dimensionValues', [])):
-                row_data[dimension_headers[i]] = dim_value['value']
+        Returns:
+            pandas DataFrame with typed metric and categorical dimension columns
+        """
+        if pa is None:
+            data = {name: col for name, col in zip(report.dimension_headers, report.dim_cols)}
+            data.update({name: self._parse_metric(dtype, col) for name, dtype, col
+                         in zip(report.metric_headers, report.metric_dtypes, report.met_cols)})
+            df = pd.DataFrame(data, copy=False)
             
-            # Add metrics
-            for i, met_value in enumerate(row.get('metricValues', [])):
-                row_data[metric_headers[i]] = float(met_value['value'])
+            for name in self._CATEGORICAL_DIMENSIONS:
+                if name in df.columns:
+                    df[name] = df[name].astype('category')
             
-            flattened_data.append(row_data)
+            return df
         
-        df = pd.DataFrame(flattened_data)
+        arrays = []
+        for name, col in zip(report.dimension_headers, report.dim_cols):
+            array = pa.array(col, type=pa.string())
+            if name in self._CATEGORICAL_DIMENSIONS:
+                # Becomes a pandas Categorical on conversion
+                array = array.dictionary_encode()
+            arrays.append(array)
         
-        # Convert date column if present
+        for dtype, col in zip(report.metric_dtypes, report.met_cols):
+            if isinstance(col, np.ndarray):
+                # Already parsed by _fill_columns, wrapped without a copy
+                arrays.append(pa.array(col))
+            else:
+                arrays.append(pa.array(col, type=pa.string()).cast(pa.from_numpy_dtype(dtype)))
+        
+        table = pa.Table.from_arrays(arrays,
+                                     names=report.dimension_headers + report.metric_headers)
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+    
+    def _build_polars_frame(self, report: _ReportColumns):
+        """
+        Build a polars DataFrame from the collected report columns
+        
+        Args:
+            report: Collected report columns
+            
+        Returns:
+            polars DataFrame with the same columns and cleaning as the pandas path
+        """
+        import polars as pl
+        
+        columns = [pl.Series(name, list(col), dtype=pl.Utf8)
+                   for name, col in zip(report.dimension_headers, report.dim_cols)]
+        columns += [pl.Series(name, self._parse_metric(dtype, col)) for name, dtype, col
+                    in zip(report.metric_headers, report.metric_dtypes, report.met_cols)]
+        df = pl.DataFrame(columns)
+        
+        conversions = [pl.col(name).cast(pl.Categorical)
+                       for name in self._CATEGORICAL_DIMENSIONS if name in df.columns]
         if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'])
+            # Datetime rather than Date, matching the datetime64 column pandas gets
+            conversions.append(pl.col('date').str.strptime(pl.Datetime, '%Y%m%d'))
+        if conversions:
+            df = df.with_columns(conversions)
         
-        return self._validate_data(df)
+        # Same cleaning as _validate_data: drop completely empty rows, stamp retrieval
+        if df.width:
+            df = df.filter(~pl.all_horizontal(pl.all().is_null()))
+        return df.with_columns(pl.lit(datetime.utcnow()).alias('retrieved_at'))
+    
+    def get_data_parallel(self, metrics: List[str], dimensions: List[str] = None,
+                          start_date: str = '30daysAgo', end_date: str = 'today',
+                          chunks: int = 4) -> pd.DataFrame:
+        """
+        Get Google Analytics data by fetching date partitions concurrently
+        
+        Args:
+            metrics: List of metrics to retrieve
+            dimensions: List of dimensions to group by; must include 'date'
+            start_date: Start date (YYYY-MM-DD or relative like '30daysAgo')
+            end_date: End date (YYYY-MM-DD or relative like 'today')
+            chunks: Number of date partitions to request in parallel
+            
+        Returns:
+            DataFrame with analytics data
+        """
+        if dimensions is None:
+            dimensions = ['date']
+        
+        # Without a date dimension the partitions would each aggregate over their
+        # own range and could not simply be stacked
+        if 'date' not in dimensions:
+            raise ValueError("get_data_parallel requires 'date' among the dimensions")
+        
+        start = self._resolve_date(start_date)
+        end = self._resolve_date(end_date)
+        total_days = (end - start).days + 1
+        if total_days < 1:
+            raise ValueError(f"Invalid date range: {start_date} to {end_date}")
+        
+        chunks = max(1, min(chunks, total_days))
+        base_days, extra_days = divmod(total_days, chunks)
+        
+        ranges = []
+        chunk_start = start
+        for i in range(chunks):
+            chunk_end = chunk_start + timedelta(days=base_days + (i < extra_days) - 1)
+            ranges.append((chunk_start.isoformat(), chunk_end.isoformat()))
+            chunk_start = chunk_end + timedelta(days=1)
+        
+        # Worker threads share this connector's session and its connection pool
+        executor = type(self)._get_executor()
+        futures = [executor.submit(self.get_data, metrics, dimensions, s, e)
+                   for s, e in ranges]
+        frames = [future.result() for future in futures]
+        
+        non_empty = [frame for frame in frames if not frame.empty]
+        if not non_empty:
+            # Every partition was empty; they all share the report's schema
+            return frames[0]
+        
+        # Partitions see different category sets; align them so concat keeps
+        # categorical dtypes and the result matches get_data's schema
+        for name, dtype in non_empty[0].dtypes.items():
+            if isinstance(dtype, pd.CategoricalDtype):
+                categories = union_categoricals([frame[name] for frame in non_empty]).categories
+                for frame in non_empty:
+                    frame[name] = frame[name].cat.set_categories(categories)
+        
+        return pd.concat(non_empty, ignore_index=True)
+    
+    @staticmethod
+    def _resolve_date(value: str) -> date:
+        """
+        Resolve a GA4 date string to a date
+        
+        Args:
+            value: YYYY-MM-DD, 'today', 'yesterday' or 'NdaysAgo'
+            
+        Returns:
+            Resolved date (relative dates use the local calendar)
+        """
+        today = date.today()
+        if value == 'today':
+            return today
+        if value == 'yesterday':
+            return today - timedelta(days=1)
+        if value.endswith('daysAgo'):
+            return today - timedelta(days=int(value[:-len('daysAgo')]))
+        return datetime.fromisoformat(value).date()
+    
+    def _parse_report(self, response) -> _ReportColumns:
+        """
+        Read a runReport response into per-column values
+        
+        Called by _make_request inside its retry loop, so a body cut off mid-read
+        is retried rather than surfacing to the caller.
+        
+        Args:
+            response: HTTP response, unread when the requests transport is used
+            
+        Returns:
+            Collected report columns; the columns are None when the report has no rows
+        """
+        if ijson is not None and self._client is None and self._should_stream(response):
+            return self._stream_columns(response)
+        
+        return self._extract_columns(self._decode_response(response))
+    
+    def _stream_columns(self, response) -> _ReportColumns:
+        """
+        Parse a runReport body straight off the socket without building the JSON tree
+        
+        Args:
+            response: Unread streamed response
+            
+        Returns:
+            Collected report columns
+        """
+        response.raw.decode_content = True
+        dimension_headers, metric_headers, metric_types = [], [], []
+        
+        def events():
+            # Headers are picked out of the same event stream that feeds the rows
+            for prefix, event, value in ijson.parse(response.raw):
+                if prefix == 'dimensionHeaders.item.name':
+                    dimension_headers.append(value)
+                elif prefix == 'metricHeaders.item.name':
+                    metric_headers.append(value)
+                elif prefix == 'metricHeaders.item.type':
+                    metric_types.append(value)
+                yield prefix, event, value
+        
+        rows = ijson.items(events(), 'rows.item')
+        first = next(rows, None)
+        if first is None:
+            # Drain the rest so trailing headers are still seen
+            for _ in rows:
+                pass
+            return self._report_columns(dimension_headers, metric_headers, metric_types,
+                                        None, None)
+        
+        # GA4 sends the headers before the rows, so they are known by now
+        dim_cols, met_cols = self._collect_columns(
+            itertools.chain((first,), rows), len(dimension_headers), len(metric_headers))
+        return self._report_columns(dimension_headers, metric_headers, metric_types,
+                                    dim_cols, met_cols)
+    
+    @classmethod
+    def _report_columns(cls, dimension_headers: List[str], metric_headers: List[str],
+                        metric_types: List[Optional[str]], dim_cols, met_cols) -> _ReportColumns:
+        """Bundle collected columns with the storage dtype of each metric"""
+        metric_types = list(metric_types) + [None] * (len(metric_headers) - len(metric_types))
+        metric_dtypes = [cls._metric_dtype(metric_type) for metric_type in metric_types]
+        return _ReportColumns(dimension_headers, metric_headers, metric_dtypes,
+                              dim_cols, met_cols)
+    
+    def _should_stream(self, response) -> bool:
+        """Decide whether a runReport response is large enough to parse incrementally"""
+        content_length = response.headers.get('Content-Length')
+        if content_length is None:
+            # Chunked responses are typically the large ones
+            return True
+        return int(content_length) > self.STREAM_THRESHOLD_BYTES
+    
+    def _extract_columns(self, response: Dict[str, Any]):
+        """
+        Extract headers and per-column values from a parsed runReport response
+        
+        Args:
+            response: Parsed runReport response
+            
+        Returns:
+            Collected report columns; the columns are None when the response has no rows
+        """
+        dimension_headers = [dim['name'] for dim in response.get('dimensionHeaders', [])]
+        metric_headers = [met['name'] for met in response.get('metricHeaders', [])]
+        metric_types = [met.get('type') for met in response.get('metricHeaders', [])]
+        
+        report = self._report_columns(dimension_headers, metric_headers, metric_types,
+                                      None, None)
+        
+        rows = response.get('rows')
+        if not rows:
+            return report
+        
+        dim_cols, met_cols = self._fill_columns(rows, len(dimension_headers),
+                                                report.metric_dtypes)
+        return report._replace(dim_cols=dim_cols, met_cols=met_cols)
+    
+    @classmethod
+    def _metric_dtype(cls, metric_type: Optional[str]) -> type:
+        """Get the storage dtype for a GA4 metric type (metricHeaders[].type)"""
+        return cls._METRIC_DTYPES.get(metric_type, np.float64)
+    
+    @staticmethod
+    def _parse_metric(dtype: type, values) -> np.ndarray:
+        """
+        Convert a column of GA4 metric values to its storage dtype
+        
+        GA4 sends metric values as strings; casting the whole column from a NumPy
+        string array parses it in C instead of calling float()/int() per cell.
+        
+        Args:
+            dtype: Storage dtype of the metric
+            values: Column of metric value strings, or an already typed array
+            
+        Returns:
+            Typed metric array
+        """
+        if isinstance(values, np.ndarray) and values.dtype == dtype:
+            return values
+        return np.asarray(values, dtype=np.str_).astype(dtype)
+    
+    @classmethod
+    def _fill_columns(cls, rows: List[Dict[str, Any]], n_dimensions: int,
+                      metric_dtypes: List[type]):
+        """
+        Fill preallocated column arrays from an already parsed list of rows
+        
+        Args:
+            rows: List of runReport rows
+            n_dimensions: Number of dimension columns
+            metric_dtypes: Storage dtype of each metric column
+            
+        Returns:
+            Tuple of (dimension arrays, metric arrays)
+        """
+        # rowCount counts every row of the query, not just this page, so size by rows
+        n = len(rows)
+        dim_arrs = [np.empty(n, dtype=object) for _ in range(n_dimensions)]
+        # Metric strings are gathered as-is and parsed per column afterwards
+        met_strs = [np.empty(n, dtype=object) for _ in metric_dtypes]
+        for ri, row in enumerate(rows):
+            for i, dim_value in enumerate(row.get('dimensionValues', ())):
+                dim_arrs[i][ri] = dim_value['value']
+            for i, met_value in enumerate(row.get('metricValues', ())):
+                met_strs[i][ri] = met_value['value']
+        met_arrs = [cls._parse_metric(dtype, col) for dtype, col in zip(metric_dtypes, met_strs)]
+        return dim_arrs, met_arrs
+    
+    @staticmethod
+    def _collect_columns(rows, n_dimensions: int, n_metrics: int):
+        """
+        Collect row values into one list per column
+        
+        Args:
+            rows: Iterable of runReport rows
+            n_dimensions: Number of dimension columns
+            n_metrics: Number of metric columns
+            
+        Returns:
+            Tuple of (dimension columns, metric columns)
+        """
+        dim_cols = [[] for _ in range(n_dimensions)]
+        met_cols = [[] for _ in range(n_metrics)]
+        for row in rows:
+            for i, dim_value in enumerate(row.get('dimensionValues', ())):
+                dim_cols[i].append(dim_value['value'])
+            for i, met_value in enumerate(row.get('metricValues', ())):
+                met_cols[i].append(met_value['value'])
+        return dim_cols, met_cols
     
     def get_traffic_overview(self, start_date: str = '30daysAgo', 
                            end_date: str = 'today') -> pd.DataFrame:
@@ -123,10 +555,8 @@ class GoogleAnalyticsConnector(BaseDataConnector):
         Returns:
             DataFrame with traffic overview
         """
-        metrics = ['sessions', 'users', 'pageviews', 'bounceRate', 'averageSessionDuration']
-        dimensions = ['date']
-        
-        return self.get_data(metrics, dimensions, start_date, end_date)
+        return self.get_data(self._OVERVIEW_METRICS, self._OVERVIEW_DIMENSIONS,
+                             start_date, end_date)
     
     def get_traffic_sources(self, start_date: str = '30daysAgo', 
                           end_date: str = 'today') -> pd.DataFrame:
@@ -140,10 +570,8 @@ class GoogleAnalyticsConnector(BaseDataConnector):
         Returns:
             DataFrame with traffic sources
         """
-        metrics = ['sessions', 'users']
-        dimensions = ['source', 'medium']
-        
-        return self.get_data(metrics, dimensions, start_date, end_date)
+        return self.get_data(self._SOURCES_METRICS, self._SOURCES_DIMENSIONS,
+                             start_date, end_date)
 
 
 class SimilarwebConnector(BaseDataConnector):
@@ -151,18 +579,32 @@ class SimilarwebConnector(BaseDataConnector):
     Connector for Similarweb API
     """
     
-    def __init__(self, api_key: str):
+    # Endpoints reported by get_available_datasets
+    _DATASETS = (
+        {'name': 'website_overview', 'description': 'Website traffic overview'},
+        {'name': 'traffic_sources', 'description': 'Website traffic sources'},
+        {'name': 'audience_interests', 'description': 'Audience interests'},
+        {'name': 'similar_sites', 'description': 'Similar websites'},
+        {'name': 'top_pages', 'description': 'Top performing pages'}
+    )
+    
+    def __init__(self, api_key: str, transport: str = 'requests', cache_ttl: float = 300):
         """
         Initialize Similarweb connector
         
         Args:
             api_key: Similarweb API key
+            transport: 'requests' or 'httpx' for HTTP/2
+            cache_ttl: Lifetime in seconds of cached daily data (monthly data is kept
+                for at least an hour); 0 disables caching
         """
         super().__init__(
             api_key=api_key,
             base_url="https://api.similarweb.com/v1",
             rate_limit_requests=100,  # Similarweb API rate limits
-            rate_limit_window=3600  # 1 hour
+            rate_limit_window=3600,  # 1 hour
+            cache_ttl=cache_ttl,
+            transport=transport
         )
     
     def _get_headers(self) -> Dict[str, str]:
@@ -178,13 +620,7 @@ class SimilarwebConnector(BaseDataConnector):
         Returns:
             List of available endpoints
         """
-        return [
-            {'name': 'website_overview', 'description': 'Website traffic overview'},
-            {'name': 'traffic_sources', 'description': 'Website traffic sources'},
-            {'name': 'audience_interests', 'description': 'Audience interests'},
-            {'name': 'similar_sites', 'description': 'Similar websites'},
-            {'name': 'top_pages', 'description': 'Top performing pages'}
-        ]
+        return [dict(dataset) for dataset in self._DATASETS]
     
     def get_website_overview(self, domain: str, start_date: str, end_date: str,
                            country: str = 'world', granularity: str = 'monthly') -> pd.DataFrame:
@@ -210,6 +646,11 @@ class SimilarwebConnector(BaseDataConnector):
         }
         
         endpoint = f'website/{domain}/total-traffic-and-engagement/visits'
+        cache_key = (endpoint, tuple(sorted(params.items())))
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached.copy()
+        
         response = self._make_request(endpoint, params)
         
         if 'visits' not in response:
@@ -217,12 +658,23 @@ class SimilarwebConnector(BaseDataConnector):
         
         visits_data = response['visits']
         
-        # Convert to DataFrame
-        df = pd.DataFrame(visits_data)
-        df['domain'] = domain
-        df['date'] = pd.to_datetime(df['date'])
+        # Convert to DataFrame column by column
+        dates = [point['date'] for point in visits_data]
+        visits = np.fromiter((point['visits'] for point in visits_data),
+                             dtype=np.float64, count=len(visits_data))
+        df = pd.DataFrame({
+            # Similarweb reports full YYYY-MM-DD dates for both granularities
+            # (monthly points fall on the first of the month)
+            'date': pd.to_datetime(dates, format='%Y-%m-%d', cache=True),
+            'visits': visits
+        }, copy=False)
+        df['domain'] = pd.Categorical([domain] * len(df), categories=[domain])
         
-        return self._validate_data(df)
+        self._validate_data(df, inplace=True)
+        # Monthly figures only change once a month, so they can live longer
+        ttl = max(3600, self._cache.default_ttl) if granularity == 'monthly' else None
+        self._cache.set(cache_key, df, ttl)
+        return df.copy()
     
     def get_traffic_sources(self, domain: str, start_date: str, end_date: str,
                           country: str = 'world') -> pd.DataFrame: